@@ -1,10 +1,23 @@
 import os
 import json
+import atexit
+import asyncio
+import hashlib
+import threading
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import httpx
+import numpy as np
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from transformers import pipeline
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
 from dotenv import load_dotenv
-from groq import Groq
+from groq import AsyncGroq
+from aiolimiter import AsyncLimiter
+from service_streamer import ThreadedStreamer
+from model_config import EMOTION_MODEL, SENTIMENT_MODEL, ONNX_MODEL_FILE, onnx_model_dir
 
 # Load environment variables from .env file
 load_dotenv()
@@ -14,22 +27,227 @@ app = Flask(__name__)
 CORS(app)
 
 # 1. Groq Client for Cloud-Powered Analysis
+# The async client and its connection pool are bound to one event loop, so all
+# Groq calls are scheduled onto a single background loop shared by every request.
+groq_loop = asyncio.new_event_loop()
+threading.Thread(target=groq_loop.run_forever, name="groq-loop", daemon=True).start()
+
+def submit_to_groq_loop(coro):
+    """Schedules a coroutine on the shared Groq event loop and returns its future."""
+    return asyncio.run_coroutine_threadsafe(coro, groq_loop)
+
+# Shared by every Groq call so bursts queue up locally instead of tripping the
+# API's requests-per-minute limit and stalling on 429 retries.
+GROQ_REQUESTS_PER_MINUTE = int(os.environ.get("GROQ_REQUESTS_PER_MINUTE", 25))
+groq_rate_limiter = AsyncLimiter(max_rate=GROQ_REQUESTS_PER_MINUTE, time_period=60)
+# Under sustained overload, requests give up on the AI review instead of holding
+# a server thread while they queue for a rate-limit slot.
+GROQ_QUEUE_TIMEOUT = 10
+# Per-attempt timeout and retry count for the Groq client itself.
+GROQ_CALL_TIMEOUT = 10
+GROQ_MAX_RETRIES = 2
+# Overall deadline for a request's AI review: the queue wait plus every client
+# attempt, with a margin for the SDK's retry backoff.
+GROQ_REFINEMENT_TIMEOUT = GROQ_QUEUE_TIMEOUT + (GROQ_MAX_RETRIES + 1) * GROQ_CALL_TIMEOUT + 5
+BUSY_SUMMARY = "The AI summary is unavailable right now due to high demand. Please try again shortly."
+TIMEOUT_SUMMARY = "The AI summary took too long to generate. Please try again."
+
+async def acquire_groq_rate_limit():
+    """Waits for a slot under the Groq rate limit, raising asyncio.TimeoutError after GROQ_QUEUE_TIMEOUT."""
+    await asyncio.wait_for(groq_rate_limiter.acquire(), timeout=GROQ_QUEUE_TIMEOUT)
+
 try:
     groq_api_key = os.environ.get("GROQ_API_KEY")
     if not groq_api_key:
         raise ValueError("GROQ_API_KEY not found in .env file")
-    groq_client = Groq(api_key=groq_api_key)
+    # One long-lived HTTP/2 session, so connections are reused instead of
+    # paying a TCP/TLS handshake on every call.
+    groq_http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=60.0),
+        timeout=GROQ_CALL_TIMEOUT,
+    )
+    groq_client = AsyncGroq(
+        api_key=groq_api_key,
+        http_client=groq_http_client,
+        timeout=GROQ_CALL_TIMEOUT,
+        max_retries=GROQ_MAX_RETRIES,
+    )
+    atexit.register(lambda: submit_to_groq_loop(groq_http_client.aclose()).result(timeout=5))
     print("Groq client initialized successfully.")
 except Exception as e:
     print(f"Error initializing Groq client: {e}")
     groq_client = None
 
 # 2. Local Classifiers
+# Half precision on GPU uses the tensor cores; CPU stays in float32 (or int8 via ONNX)
+DEVICE = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+TORCH_DTYPE = torch.float16 if DEVICE.type == "cuda" else torch.float32
+if DEVICE.type == "cuda":
+    torch.backends.cuda.matmul.allow_tf32 = True
+
+# Texts in a streamer batch are sorted by length and run in micro-batches of this
+# size, so each forward pass only pads up to the longest of similar-length texts.
+MICRO_BATCH_SIZE = 8
+# Inputs are truncated to this many tokens and padded to a multiple of 8, which
+# keeps the set of tensor shapes small for torch.compile and the GPU kernels.
+MAX_SEQUENCE_LENGTH = 128
+# Short, medium and truncated-length inputs, so the first real requests don't pay
+# for lazy initialization, CUDA kernel selection or torch.compile tracing.
+WARMUP_TEXTS = ["warmup", "warmup " * 30, "warmup " * MAX_SEQUENCE_LENGTH]
+
+class TextClassifier:
+    """Tokenizer + sequence classification model, called directly instead of via pipeline()."""
+
+    def __init__(self, model_name):
+        self.tokenizer, self.model = self._load(model_name)
+        config = self.model.config
+        self.labels = np.array([config.id2label[i] for i in range(config.num_labels)])
+        # Same activation pipeline() would pick for this model
+        self.multi_label = config.problem_type == "multi_label_classification"
+        # ONNX Runtime models are already optimized at export time
+        if isinstance(self.model, torch.nn.Module):
+            self._accelerate(model_name)
+        else:
+            self.warm_up()
+
+    def warm_up(self):
+        """Runs dummy inputs of several lengths and batch sizes through the model once."""
+        for text in WARMUP_TEXTS:
+            self([text])
+            self([text] * MICRO_BATCH_SIZE)
+
+    def _accelerate(self, model_name):
+        """Compiles the forward pass with torch.compile where supported."""
+        eager_model = self.model
+        try:
+            self.model = torch.compile(eager_model, dynamic=True)
+            self.warm_up()  # Compilation happens on the first calls
+        except Exception as e:
+            print(f"torch.compile not applied to {model_name}: {e}")
+            self.model = eager_model
+            self.warm_up()
+
+    @staticmethod
+    def _load(model_name):
+        """
+        Loads the int8 ONNX export of a model if there is one and no GPU is available,
+        otherwise the PyTorch model on DEVICE.
+        """
+        onnx_dir = onnx_model_dir(model_name)
+        if DEVICE.type == "cpu" and os.path.isdir(onnx_dir):
+            try:
+                from optimum.onnxruntime import ORTModelForSequenceClassification
+                model = ORTModelForSequenceClassification.from_pretrained(onnx_dir, file_name=ONNX_MODEL_FILE)
+                print(f"Using quantized ONNX model for {model_name}.")
+                return AutoTokenizer.from_pretrained(onnx_dir, use_fast=True), model
+            except Exception as e:
+                print(f"Could not load ONNX model for {model_name}, using PyTorch instead: {e}")
+        # SDPA gives the fused attention kernel natively
+        model = AutoModelForSequenceClassification.from_pretrained(
+            model_name, dtype=TORCH_DTYPE, attn_implementation="sdpa"
+        )
+        model = model.to(DEVICE).eval()
+        return AutoTokenizer.from_pretrained(model_name, use_fast=True), model
+
+    def __call__(self, texts):
+        """Returns a (len(texts), num_labels) tensor of label probabilities, in input order."""
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        probabilities = [None] * len(texts)
+        with torch.inference_mode():
+            for start in range(0, len(order), MICRO_BATCH_SIZE):
+                indices = order[start:start + MICRO_BATCH_SIZE]
+                encoded = self.tokenizer(
+                    [texts[i] for i in indices], padding=True, truncation=True,
+                    max_length=MAX_SEQUENCE_LENGTH, pad_to_multiple_of=8, return_tensors="pt",
+                )
+                if DEVICE.type == "cuda":
+                    # Pinned buffers let the host-to-device copy run asynchronously
+                    encoded = {name: tensor.pin_memory().to(DEVICE, non_blocking=True) for name, tensor in encoded.items()}
+                logits = self.model(**encoded).logits.float()
+                scores = torch.sigmoid(logits) if self.multi_label else torch.softmax(logits, dim=-1)
+                for i, row in zip(indices, scores):
+                    probabilities[i] = row
+        return torch.stack(probabilities).cpu()
+
 print("Loading local classifiers...")
-emotion_classifier = pipeline("text-classification", model="SamLowe/roberta-base-go_emotions", top_k=None)
-sentiment_classifier = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
+emotion_classifier = TextClassifier(EMOTION_MODEL)
+sentiment_classifier = TextClassifier(SENTIMENT_MODEL)
 print("All local models loaded.")
 
+# 3. Dynamic Batching
+# Concurrent requests are collected by the streamers and scored as a single batch.
+CANDIDATE_EMOTION_COUNT = 5
+
+def batch_predict_emotion(texts):
+    """
+    Returns the top candidate emotions for each text as a (labels, scores) pair of
+    parallel arrays, sorted from highest to lowest score.
+    """
+    probabilities = emotion_classifier(texts).numpy()
+    # Partial selection of the top candidates, then a sort of just those
+    top_indices = np.argpartition(-probabilities, CANDIDATE_EMOTION_COUNT, axis=-1)[:, :CANDIDATE_EMOTION_COUNT]
+    results = []
+    for scores, indices in zip(probabilities, top_indices):
+        indices = indices[np.argsort(-scores[indices])]
+        labels, top_scores = emotion_classifier.labels[indices], scores[indices]
+        # Results are cached and shared between requests
+        labels.flags.writeable = top_scores.flags.writeable = False
+        results.append((labels, top_scores))
+    return results
+
+def batch_predict_sentiment(texts):
+    """Returns the top sentiment label with its score for each text."""
+    labels = sentiment_classifier.labels
+    scores, indices = sentiment_classifier(texts).max(dim=-1)
+    return [{"label": labels[i], "score": score} for i, score in zip(indices.tolist(), scores.tolist())]
+
+def catch_batch_errors(batch_predict):
+    """
+    service-streamer doesn't handle errors from the predict function, so one exception
+    would kill its only worker thread. Instead, the exception is returned as the result
+    for every text in the batch, and re-raised by the caller for that request only.
+    """
+    @functools.wraps(batch_predict)
+    def wrapper(texts):
+        try:
+            return batch_predict(texts)
+        except Exception as e:
+            print(f"Batch prediction with {batch_predict.__name__} failed: {e}")
+            return [e] * len(texts)
+    return wrapper
+
+emotion_streamer = ThreadedStreamer(catch_batch_errors(batch_predict_emotion), batch_size=32, max_latency=0.05)
+sentiment_streamer = ThreadedStreamer(catch_batch_errors(batch_predict_sentiment), batch_size=32, max_latency=0.05)
+
+# The sentiment classifier is independent of the emotion/Groq stages, so it runs
+# on this pool alongside them. Sized to the streamer batch so batches can still fill.
+classifier_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="classifier")
+
+# 4. Result Caches
+# Repeated submissions skip the forward passes and the Groq round trip.
+# Cached entries are shared between requests, so callers must not mutate them.
+@functools.lru_cache(maxsize=8192)
+def classify_emotions(text):
+    """Returns the (labels, scores) arrays of the top candidate emotions for the text."""
+    emotion_result = emotion_streamer.predict([text])[0]
+    # Raising keeps failed predictions out of the cache
+    if isinstance(emotion_result, Exception):
+        raise emotion_result
+    return emotion_result
+
+@functools.lru_cache(maxsize=8192)
+def classify_sentiment(text):
+    sentiment_result = sentiment_streamer.predict([text])[0]
+    if isinstance(sentiment_result, Exception):
+        raise sentiment_result
+    return sentiment_result
+
+# Successful Groq responses, keyed by a hash of the prompt. Only touched from
+# coroutines on groq_loop, so no lock is needed.
+REFINED_CACHE_SIZE = 4096
+refined_analysis_cache = OrderedDict()
+
 
 # --- Emoji Map ---
 EMOJI_MAP = {
@@ -40,78 +258,152 @@ EMOJI_MAP = {
     'remorse': '😔', 'sadness': '😢', 'surprise': '😲', 'neutral': '😐'
 }
 
-def get_refined_analysis_with_groq(text, emotions):
-    """
-    Uses the Groq API (Llama 3) to act as an expert reviewer.
-    It refines the emotion list, provides a summary, and gives explanations.
-    """
-    if not groq_client:
-        return {
-            "summary": "Could not generate an AI summary.",
-            "emotions": emotions
-        }
-
-    candidate_emotions = ", ".join([f"'{e['label']}'" for e in emotions])
-
-    system_prompt = (
+# Static and placed first in every refinement request, so Groq sees a byte-identical
+# prompt prefix it can reuse across calls. Built once rather than per request.
+REFINEMENT_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
         "You are an expert emotion analysis AI. You will be given a user's text and a list of candidate emotions "
         "detected by a less advanced model. Your tasks are:\n"
         "1. From the candidate list, identify the 1 to 4 most accurate emotions for the text.\n"
         "2. For each accurate emotion you identify, provide a simple, one-sentence explanation referencing the text.\n"
         "3. Write an insightful, user-friendly summary (2-3 simple sentences) of the overall emotional tone. Describe the primary feeling and how any secondary emotions add complexity.\n"
-        "4. Format your response as a JSON object with three keys: 'summary', 'emotions'. "
+        "4. Classify the overall sentiment of your summary as 'Positive', 'Negative', or 'Neutral'.\n"
+        "5. Format your response as a JSON object with three keys: 'summary', 'sentiment', 'emotions'. "
+        "The 'sentiment' key should be exactly one of 'Positive', 'Negative', or 'Neutral'. "
         "The 'emotions' key should be an array of objects, where each object has 'label' and 'explanation' keys. "
         "Only include the emotions you have identified as accurate."
     )
-    
+}
+
+def build_refinement_messages(text, labels):
+    """Builds the chat messages asking Llama 3 to review the candidate emotions."""
+    candidate_emotions = ", ".join([f"'{label}'" for label in labels])
     user_prompt = f"Text: \"{text}\"\nCandidate Emotions: [{candidate_emotions}]"
 
+    return [
+        REFINEMENT_SYSTEM_MESSAGE,
+        {"role": "user", "content": user_prompt}
+    ]
+
+def refinement_cache_key(messages):
+    return hashlib.blake2b(messages[-1]["content"].encode("utf-8"), digest_size=16).digest()
+
+def get_cached_refinement(cache_key):
+    cached_content = refined_analysis_cache.get(cache_key)
+    if cached_content is None:
+        return None
+    refined_analysis_cache.move_to_end(cache_key)
+    return json.loads(cached_content)
+
+def cache_refinement(cache_key, refined_data):
+    refined_analysis_cache[cache_key] = json.dumps(refined_data)
+    if len(refined_analysis_cache) > REFINED_CACHE_SIZE:
+        refined_analysis_cache.popitem(last=False)
+
+def fallback_refinement(summary, labels):
+    """Used when Groq is unavailable: keeps every candidate, without explanations."""
+    return {
+        "summary": summary,
+        "sentiment": "Neutral",
+        "emotions": [{"label": label} for label in labels]
+    }
+
+def parse_refined_analysis(response_content):
+    """Parses the JSON object in the model's response and validates its sentiment."""
+    refined_data = json.loads(response_content)
+    # Ensure the sentiment is one of the three expected values
+    if refined_data.get("sentiment") not in ["Positive", "Negative", "Neutral"]:
+        refined_data["sentiment"] = "Neutral"
+    return refined_data
+
+async def get_refined_analysis_with_groq(text, labels):
+    """
+    Uses the Groq API (Llama 3) to act as an expert reviewer.
+    It refines the emotion list, provides a summary, gives explanations and
+    classifies the summary's sentiment, all in a single JSON-mode call.
+    """
+    if not groq_client:
+        return fallback_refinement("Could not generate an AI summary.", labels)
+
+    messages = build_refinement_messages(text, labels)
+    cache_key = refinement_cache_key(messages)
+    cached_data = get_cached_refinement(cache_key)
+    if cached_data is not None:
+        return cached_data
+
     try:
-        chat_completion = groq_client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
+        await acquire_groq_rate_limit()
+        chat_completion = await groq_client.chat.completions.create(
+            messages=messages,
             model="llama3-8b-8192",
             temperature=0.3,
-            max_tokens=300,
+            max_tokens=350,
             response_format={"type": "json_object"},
         )
         
         response_content = chat_completion.choices[0].message.content
-        refined_data = json.loads(response_content)
+        refined_data = parse_refined_analysis(response_content)
+        cache_refinement(cache_key, refined_data)
         return refined_data
 
+    except asyncio.TimeoutError:
+        print("Timed out waiting for the Groq rate limiter.")
+        return fallback_refinement(BUSY_SUMMARY, labels)
     except Exception as e:
         print(f"Groq API call for refined analysis failed: {e}")
-        return {
-            "summary": "An error occurred while generating the AI summary.",
-            "emotions": emotions
+        return fallback_refinement("An error occurred while generating the AI summary.", labels)
+
+def get_sentiment_score(sentiment_result):
+    """Signed score from the local sentiment classifier (negative for NEGATIVE)."""
+    sentiment_score = sentiment_result['score']
+    if sentiment_result['label'].upper() == 'NEGATIVE': 
+        sentiment_score *= -1
+    return sentiment_score
+
+def build_analysis_payload(refined_analysis, candidate_labels, candidate_scores, sentiment_score):
+    """Merges the Groq review with the local scores into the final response."""
+    explanations = {}
+    for refined_emotion in refined_analysis.get("emotions", []):
+        explanations.setdefault(refined_emotion.get("label"), refined_emotion.get("explanation"))
+
+    # One pass over the candidates keeps the ones Groq confirmed and sums their scores.
+    # Candidates are already sorted by score, and normalizing keeps that order.
+    kept_emotions = []
+    total_score = 0.0
+    for label, score in zip(candidate_labels.tolist(), candidate_scores.tolist()):
+        if label in explanations:
+            kept_emotions.append((label, score, explanations[label]))
+            total_score += score
+
+    equal_share = 1 / len(kept_emotions) if kept_emotions else 0
+    final_emotions_list = [
+        {
+            "label": label,
+            "score": score / total_score if total_score > 0 else equal_share,
+            "explanation": explanation,
+            "emoji": EMOJI_MAP.get(label, '😐')
         }
+        for label, score, explanation in kept_emotions
+    ]
 
-def get_sentiment_from_summary(summary):
-    """Uses Groq to classify the summary's sentiment."""
-    if not groq_client:
-        return "Neutral" # Fallback
-    try:
-        chat_completion = groq_client.chat.completions.create(
-            messages=[
-                {"role": "system", "content": "Read the following summary of an emotional analysis. Classify the overall sentiment as 'Positive', 'Negative', or 'Neutral'. Respond with only one of these three words."},
-                {"role": "user", "content": f"Summary: \"{summary}\""}
-            ],
-            model="llama3-8b-8192",
-            temperature=0,
-            max_tokens=10,
-        )
-        sentiment = chat_completion.choices[0].message.content.strip()
-        # Ensure the response is one of the three expected values
-        if sentiment in ["Positive", "Negative", "Neutral"]:
-            return sentiment
-        return "Neutral" # Fallback if the response is unexpected
-    except Exception as e:
-        print(f"Groq API call for sentiment classification failed: {e}")
-        return "Neutral"
+    if not final_emotions_list:
+        final_emotions_list = [{"label": "neutral", "score": 1, "explanation": "The text appears to be emotionally neutral.", "emoji": "😐"}]
+        refined_analysis['summary'] = "No strong emotions were detected in the text."
+        refined_analysis['sentiment'] = "Neutral"
+
+    # The sentiment label comes from the AI summary for consistency
+    final_summary = refined_analysis.get("summary", "Summary could not be generated.")
+    final_sentiment_label = refined_analysis.get("sentiment", "Neutral")
 
+    sentiment_data = {"label": final_sentiment_label, "score": sentiment_score}
+
+    # Construct the final JSON
+    return {
+        "sentiment": sentiment_data,
+        "summary": final_summary,
+        "emotions": final_emotions_list
+    }
 
 @app.route('/analyze', methods=['POST'])
 def analyze_emotions_final():
@@ -122,63 +414,25 @@ def analyze_emotions_final():
 
     try:
         # --- Stage 1: Candidate Generation (Local Model) ---
-        emotion_results = emotion_classifier(user_text)[0]
-        emotion_results.sort(key=lambda x: x['score'], reverse=True)
-        
-        candidate_emotions = emotion_results[:5]
+        # Both local models are uncased, so differently-cased texts share cache entries
+        classifier_text = user_text.lower()
+        sentiment_future = classifier_pool.submit(classify_sentiment, classifier_text)
+        candidate_labels, candidate_scores = classify_emotions(classifier_text)
 
-        # Get initial sentiment score, but we will overwrite the label later
-        sentiment_result = sentiment_classifier(user_text)[0]
-        sentiment_score = sentiment_result['score']
-        if sentiment_result['label'].upper() == 'NEGATIVE': 
-            sentiment_score *= -1
-        
         # --- Stage 2: Expert Review & Final Decision (Llama 3) ---
-        emotions_data_for_llm = [{"label": e['label'], "score": e['score']} for e in candidate_emotions]
-        refined_analysis = get_refined_analysis_with_groq(user_text, emotions_data_for_llm)
-
-        raw_scores_map = {e['label']: e['score'] for e in candidate_emotions}
-        
-        final_emotions_list = []
-        for refined_emotion in refined_analysis.get("emotions", []):
-            label = refined_emotion.get("label")
-            if label in raw_scores_map:
-                final_emotions_list.append({
-                    "label": label,
-                    "score": raw_scores_map[label],
-                    "explanation": refined_emotion.get("explanation"),
-                    "emoji": EMOJI_MAP.get(label, '😐')
-                })
-        
-        total_score = sum(e['score'] for e in final_emotions_list)
-        if total_score > 0:
-            for emotion in final_emotions_list:
-                emotion['score'] = emotion['score'] / total_score
-        elif final_emotions_list:
-            equal_share = 1 / len(final_emotions_list)
-            for emotion in final_emotions_list:
-                emotion['score'] = equal_share
-
-        final_emotions_list.sort(key=lambda x: x['score'], reverse=True)
-
-        if not final_emotions_list:
-            final_emotions_list = [{"label": "neutral", "score": 1, "explanation": "The text appears to be emotionally neutral.", "emoji": "😐"}]
-            refined_analysis['summary'] = "No strong emotions were detected in the text."
-
-        # --- NEW FINAL STEP: Get sentiment from the AI summary for consistency ---
-        final_summary = refined_analysis.get("summary", "Summary could not be generated.")
-        final_sentiment_label = get_sentiment_from_summary(final_summary)
-        
-        sentiment_data = {"label": final_sentiment_label, "score": sentiment_score}
+        # Started as soon as the candidates are ready, while sentiment may still be running
+        refined_future = submit_to_groq_loop(get_refined_analysis_with_groq(user_text, candidate_labels.tolist()))
 
-        # Construct the final JSON
-        final_analysis_payload = {
-            "sentiment": sentiment_data,
-            "summary": final_summary,
-            "emotions": final_emotions_list
-        }
+        # Get initial sentiment score, but we will overwrite the label later
+        sentiment_score = get_sentiment_score(sentiment_future.result())
 
-        return jsonify(final_analysis_payload)
+        try:
+            refined_analysis = refined_future.result(timeout=GROQ_REFINEMENT_TIMEOUT)
+        except FutureTimeoutError:
+            print("Groq refinement timed out.")
+            refined_future.cancel()
+            refined_analysis = fallback_refinement(TIMEOUT_SUMMARY, candidate_labels.tolist())
+        return jsonify(build_analysis_payload(refined_analysis, candidate_labels, candidate_scores, sentiment_score))
 
     except Exception as e:
         print(f"Error in final analysis endpoint: {e}")
@@ -186,4 +440,6 @@ def analyze_emotions_final():
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    # Development server only; use gunicorn (see gunicorn.conf.py) in production.
+    # The reloader is left off since it would load the models twice.
+    app.run(port=5000, threaded=True)
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Exports the local classifiers to ONNX and applies dynamic int8 quantization.
+
+Needs the optional export dependencies, installed in their own virtual
+environment since they pin an older transformers than the server uses.
+Run once from the backend directory:
+
+    python -m venv export-venv
+    source export-venv/bin/activate
+    pip install -r requirements-export.txt
+    python export_onnx.py
+
+app.py picks up the quantized models from onnx_models/ on its next start and
+falls back to the regular PyTorch models when they are missing.
+"""
+import argparse
+from transformers import AutoTokenizer
+from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+from optimum.onnxruntime.configuration import AutoQuantizationConfig
+from model_config import EMOTION_MODEL, SENTIMENT_MODEL, onnx_model_dir
+
+DEFAULT_MODELS = [EMOTION_MODEL, SENTIMENT_MODEL]
+
+QUANTIZATION_CONFIGS = {
+    "avx512_vnni": AutoQuantizationConfig.avx512_vnni,
+    "avx2": AutoQuantizationConfig.avx2,
+    "arm64": AutoQuantizationConfig.arm64,
+}
+
+
+def export_model(model_name, arch):
+    """Exports a Hugging Face model to ONNX and saves an int8 copy next to it."""
+    save_dir = onnx_model_dir(model_name)
+
+    print(f"Exporting {model_name} to ONNX...")
+    model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    model.save_pretrained(save_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(save_dir)
+
+    print(f"Quantizing {model_name} for {arch}...")
+    quantization_config = QUANTIZATION_CONFIGS[arch](is_static=False, per_channel=False)
+    quantizer = ORTQuantizer.from_pretrained(model)
+    quantizer.quantize(save_dir=save_dir, quantization_config=quantization_config)
+    print(f"Saved quantized model to {save_dir}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("models", nargs="*", default=DEFAULT_MODELS, help="Hugging Face model names to export.")
+    parser.add_argument("--arch", choices=QUANTIZATION_CONFIGS, default="avx512_vnni",
+                        help="Target instruction set for the int8 kernels.")
+    args = parser.parse_args()
+
+    for model_name in args.models:
+        export_model(model_name, args.arch)
@@ -0,0 +1,15 @@
+# Production server settings: gunicorn -c gunicorn.conf.py app:app
+#
+# A single worker process holds one copy of the models; its threads share the
+# classifier streamers, so concurrent requests are batched into one forward pass
+# while others wait on Groq. The app is not preloaded because the streamer and
+# Groq event-loop threads started at import time would not survive the fork.
+bind = "127.0.0.1:5000"
+workers = 1
+worker_class = "gthread"
+threads = 32
+# Without --preload, model download, loading and torch.compile warm-up all run
+# in the worker before its first heartbeat, and gunicorn counts that time against
+# this timeout. Keep it generous so a cold start isn't killed and respawned forever;
+# gthread workers heartbeat from their main loop, so slow requests are unaffected.
+timeout = 600
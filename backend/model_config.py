@@ -0,0 +1,14 @@
+"""Local model names and ONNX export paths, shared by app.py and export_onnx.py."""
+import os
+
+EMOTION_MODEL = "joeddav/distilbert-base-uncased-go-emotions-student"
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+
+# Written by export_onnx.py, loaded by app.py when present
+ONNX_MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "onnx_models")
+# Name ORTQuantizer gives the int8 model it saves
+ONNX_MODEL_FILE = "model_quantized.onnx"
+
+def onnx_model_dir(model_name):
+    """Directory holding the ONNX export of a Hugging Face model."""
+    return os.path.join(ONNX_MODELS_DIR, model_name.replace("/", "__"))